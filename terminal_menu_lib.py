@@ -10,20 +10,148 @@ License: MIT
 import sys
 import os
 import json
+import queue
+import re
+import unicodedata
 import shutil
+import signal
 import threading
 import time
+from collections import deque
+from functools import lru_cache
 from typing import Dict, List, Optional, Callable, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
+# Optional fast JSON parser; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Platform detection for keyboard input
 if sys.platform == "win32":
     import msvcrt
+
+    def _enable_windows_vt() -> bool:
+        """Turn on ANSI escape processing for the console (Windows 10+).
+
+        With ENABLE_VIRTUAL_TERMINAL_PROCESSING set, the console accepts
+        the same escape sequences as POSIX terminals and the renderer
+        never has to spawn cmd.exe for a screen clear.
+        """
+        try:
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+            mode = ctypes.c_uint32()
+            if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+                return False
+            ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+            if mode.value & ENABLE_VIRTUAL_TERMINAL_PROCESSING:
+                return True
+            return bool(kernel32.SetConsoleMode(
+                handle, mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING))
+        except Exception:
+            return False
+
+    _VT_ENABLED = _enable_windows_vt()
 else:
     import tty
     import termios
-    import select
+    import selectors
+
+    # POSIX terminals speak ANSI natively
+    _VT_ENABLED = True
+
+
+# Parsed JSON configs keyed by (resolved path, mtime); a touched file
+# gets a new key, so stale entries are never served
+_JSON_CACHE: Dict[Tuple[str, float], dict] = {}
+
+# Matches the parameter list of an SGR escape sequence like "\033[106m"
+_SGR_RE = re.compile(r"\033\[([\d;]+)m")
+
+
+def _sgr(*params: str) -> str:
+    """Build a single SGR escape sequence from raw parameter strings."""
+    return "\033[" + ";".join(params) + "m"
+
+
+@lru_cache(maxsize=32)
+def _merge_sgr(*sequences: str) -> str:
+    """
+    Collapse consecutive SGR escape sequences into a single one,
+    e.g. "\\033[106m" + "\\033[30m" -> "\\033[106;30m".
+
+    Falls back to plain concatenation if any input is not purely SGR.
+    The same few theme combinations recur, so results are memoized.
+    """
+    params = []
+    for seq in sequences:
+        found = _SGR_RE.findall(seq)
+        if not found or _SGR_RE.sub("", seq):
+            return "".join(sequences)
+        params.extend(found)
+    return _sgr(*params)
+
+
+class MenuError(Exception):
+    """Base class for errors raised by this library.
+
+    Subclasses store their context and defer message formatting to
+    __str__, so an error that is caught and never displayed costs
+    nothing to build.
+    """
+
+
+class EntryActionError(MenuError):
+    """An entry's action raised an exception."""
+
+    def __init__(self, label: str, cause: BaseException):
+        super().__init__()
+        self.label = label
+        self.cause = cause
+
+    def __str__(self) -> str:
+        return f"Error executing action for entry '{self.label}': {self.cause}"
+
+
+class PageNotFoundError(MenuError):
+    """A navigation target references a page that does not exist."""
+
+    def __init__(self, page_name: str):
+        super().__init__()
+        self.page_name = page_name
+
+    def __str__(self) -> str:
+        return f"Page '{self.page_name}' does not exist"
+
+
+class DuplicatePageError(MenuError):
+    """A page was added with a name that is already taken."""
+
+    def __init__(self, page_name: str):
+        super().__init__()
+        self.page_name = page_name
+
+    def __str__(self) -> str:
+        return f"Page '{self.page_name}' already exists"
+
+
+class InvalidEntryConfigError(MenuError):
+    """A JSON config entry is malformed (e.g. missing its label)."""
+
+    def __init__(self, json_path: str, page_name: str, index: int, reason: str):
+        super().__init__()
+        self.json_path = json_path
+        self.page_name = page_name
+        self.index = index
+        self.reason = reason
+
+    def __str__(self) -> str:
+        return (f"Invalid entry #{self.index} on page '{self.page_name}' "
+                f"in '{self.json_path}': {self.reason}")
 
 
 class Colors:
@@ -83,6 +211,78 @@ class BoxChars:
     CROSS = "┼"
 
 
+# Box-drawing chars pre-encoded for the bytes render path (3 bytes each)
+_TOP_LEFT_B = BoxChars.TOP_LEFT.encode('utf-8')
+_TOP_RIGHT_B = BoxChars.TOP_RIGHT.encode('utf-8')
+_VERTICAL_B = BoxChars.VERTICAL.encode('utf-8')
+
+# Shared padding block; slicing it avoids allocating a fresh spaces
+# string per row (frame widths are capped well below this)
+_SPACES = b" " * 256
+
+# DEC private mode 2026 (synchronized output): the terminal holds
+# everything between the two markers and presents it atomically.
+# VT-parsing terminals without support ignore the sequences; legacy
+# consoles (_VT_ENABLED False) would print them, so emission is gated.
+_SYNC_BEGIN = b"\033[?2026h"
+_SYNC_END = b"\033[?2026l"
+
+# Pre-built vertical padding blocks for the full-repaint path; sliced
+# per frame instead of multiplying a fresh bytes object each time.
+# "\033[K\n" is 4 bytes per row, "\n" is 1.
+_ERASE_NL_BLOCK = b"\033[K\n" * 64
+_NL_BLOCK = b"\n" * 64
+
+
+def _pad_bytes(n: int) -> bytes:
+    """Return n spaces as bytes, sliced from the shared block."""
+    return _SPACES[:n] if n <= 256 else b" " * n
+
+
+@lru_cache(maxsize=256)
+def _display_width(text: str) -> int:
+    """Terminal cell width of a string.
+
+    East Asian wide and fullwidth characters occupy two cells, so
+    len() under-counts them and CJK labels would overflow the frame.
+    """
+    if text.isascii():
+        return len(text)
+    eaw = unicodedata.east_asian_width
+    return sum(2 if eaw(ch) in ('W', 'F') else 1 for ch in text)
+
+
+@lru_cache(maxsize=16)
+def _compute_layout(term_width: int, term_height: int, n_entries: int) -> Tuple[int, int, int, int]:
+    """Frame geometry for a terminal size and entry count.
+
+    Returns (content_width, content_height, x_offset, y_offset).
+    Pure arithmetic, so the handful of (size, entries) combinations a
+    session sees are computed once.
+    """
+    content_width = min(term_width - 4, 70)
+    content_height = min(term_height - 6, n_entries + 8)
+    x_offset = (term_width - content_width - 2) // 2
+    y_offset = max(1, (term_height - content_height) // 2)
+    return content_width, content_height, x_offset, y_offset
+
+
+@lru_cache(maxsize=32)
+def _hline(width: int) -> str:
+    """Horizontal box-drawing rule of the given width."""
+    return BoxChars.HORIZONTAL * width
+
+
+@lru_cache(maxsize=32)
+def _hline_bytes(width: int) -> bytes:
+    """UTF-8 encoded horizontal rule (3 bytes per box char).
+
+    Cached at module level because it depends only on the width, not
+    the theme, so it survives set_theme() template-cache flushes.
+    """
+    return _hline(width).encode('utf-8')
+
+
 class KeyCode(Enum):
     """Keyboard key codes."""
     UP = "UP"
@@ -97,171 +297,247 @@ class KeyCode(Enum):
 class KeyboardInput:
     """Cross-platform keyboard input handler with proper arrow key detection."""
 
+    # Dispatch tables built once at class creation; per-keystroke parsing
+    # only pays a dict/set lookup. Keys are raw byte values as read from
+    # the terminal, so no decoding happens on the hot path.
+    _WINDOWS_EXT_MAP = {
+        b'H': KeyCode.UP,     # 0x48
+        b'P': KeyCode.DOWN,   # 0x50
+        b'M': KeyCode.RIGHT,  # 0x4D
+        b'K': KeyCode.LEFT,   # 0x4B
+    }
+    _POSIX_ARROW_MAP = {
+        0x41: KeyCode.UP,     # 'A'
+        0x42: KeyCode.DOWN,   # 'B'
+        0x43: KeyCode.RIGHT,  # 'C'
+        0x44: KeyCode.LEFT,   # 'D'
+    }
+    _EXT_PREFIX_BYTES = frozenset((b'\x00', b'\xe0'))
+    _ENTER_BYTES = frozenset((b'\r', b'\n'))
+
     def __init__(self):
         self._running = False
-        self._key_buffer: List[str] = []
-        self._lock = threading.Lock()
+        # Bumped by every start(); reader threads capture the value and
+        # retire when it no longer matches, so a stale Windows reader
+        # left blocked in getch() by a previous stop() cannot resume
+        # its loop and race a newer one for prefix/code byte pairs
+        self._generation = 0
+        # Holds fully parsed KeyCode values; the reader threads decode
+        # escape sequences before pushing. SimpleQueue blocks in C on a
+        # semaphore, so there is no Python-level lock on either side.
+        # A None sentinel pushed by stop() unblocks a waiting consumer.
+        self._key_buffer: 'queue.SimpleQueue[Optional[KeyCode]]' = queue.SimpleQueue()
         self._thread: Optional[threading.Thread] = None
 
         if sys.platform != "win32":
             self._old_settings = None
+            # Self-pipe used to wake the blocking selector on stop()
+            self._wake_r: Optional[int] = None
+            self._wake_w: Optional[int] = None
+            # Registered once in start(); epoll-backed on Linux
+            self._selector: Optional['selectors.BaseSelector'] = None
 
     def start(self) -> None:
         """Start non-blocking keyboard input capture."""
         self._running = True
+        self._generation += 1
 
         if sys.platform != "win32":
             self._old_settings = termios.tcgetattr(sys.stdin)
             tty.setcbreak(sys.stdin.fileno())
+            self._wake_r, self._wake_w = os.pipe()
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(sys.stdin.fileno(), selectors.EVENT_READ, data="stdin")
+            self._selector.register(self._wake_r, selectors.EVENT_READ, data="wake")
 
-        self._thread = threading.Thread(target=self._input_loop, daemon=True)
+        self._thread = threading.Thread(
+            target=self._input_loop, args=(self._generation,), daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
         """Stop keyboard input capture and restore terminal settings."""
         self._running = False
 
-        if sys.platform != "win32" and self._old_settings:
-            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self._old_settings)
+        # Wake up any consumer blocked in get_key() so it can exit cleanly
+        self._key_buffer.put(None)
 
-    def _input_loop(self) -> None:
+        if sys.platform != "win32":
+            # Wake the input thread blocked in select() so it can exit
+            if self._wake_w is not None:
+                try:
+                    os.write(self._wake_w, b"\x00")
+                except OSError:
+                    pass
+            if self._thread is not None:
+                self._thread.join(timeout=1.0)
+                self._thread = None
+            if self._selector is not None:
+                self._selector.close()
+                self._selector = None
+            for fd in (self._wake_r, self._wake_w):
+                if fd is not None:
+                    try:
+                        os.close(fd)
+                    except OSError:
+                        pass
+            self._wake_r = self._wake_w = None
+
+            if self._old_settings:
+                termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self._old_settings)
+
+    def _input_loop(self, generation: int) -> None:
         """Background thread for capturing keyboard input."""
-        while self._running:
+        if sys.platform == "win32":
+            self._windows_loop(generation)
+        else:
+            self._posix_loop()
+
+    def _push_keys(self, keys: List[KeyCode]) -> None:
+        """Push parsed keys onto the buffer and wake the consumer."""
+        put = self._key_buffer.put
+        for key in keys:
+            put(key)
+
+    def _windows_loop(self, generation: int) -> None:
+        """Windows input loop: block in getch() until a key arrives.
+
+        getch() blocks at the OS level, so the thread sleeps in the
+        kernel instead of spinning on kbhit(). Extended keys arrive as
+        a 0x00/0xe0 prefix plus a code byte; both are consumed here so
+        the buffer only ever holds parsed KeyCodes. The thread is a
+        daemon, so a read still pending at shutdown does not block
+        exit.
+
+        getch() cannot be interrupted, so stop() cannot join this
+        thread; it instead retires itself once its generation is stale
+        — after a restart, the byte that finally unblocks the old
+        reader is dropped and the thread exits without touching the
+        queue, so two readers never interleave a prefix/code pair.
+        """
+        while self._running and self._generation == generation:
             try:
-                if sys.platform == "win32":
-                    # Windows: msvcrt.kbhit() checks if input is available
-                    if msvcrt.kbhit():
-                        char = msvcrt.getch()
-                        with self._lock:
-                            self._key_buffer.append(char)
+                char = msvcrt.getch()
+                if self._generation != generation:
+                    return
+                if char in self._EXT_PREFIX_BYTES:
+                    code = msvcrt.getch()
+                    key = self._WINDOWS_EXT_MAP.get(code, KeyCode.UNKNOWN)
+                elif char in self._ENTER_BYTES:
+                    key = KeyCode.ENTER
+                elif char == b'\x1b':
+                    key = KeyCode.ESC
                 else:
-                    # Linux/Unix: select checks if input is available
-                    fd = sys.stdin.fileno()
-                    if select.select([fd], [], [], 0.01)[0]:
-                        data = os.read(fd, 64)
-                        if data:
-                            chunk = data.decode('latin-1', errors='ignore')
-                            with self._lock:
-                                self._key_buffer.extend(list(chunk))
-                time.sleep(0.01)
+                    key = KeyCode.UNKNOWN
+                if self._generation == generation:
+                    self._push_keys([key])
             except Exception:
                 pass
 
-    def get_key(self) -> Optional[KeyCode]:
+    def _parse_posix_bytes(self, data: bytes) -> Tuple[List[KeyCode], bytes]:
         """
-        Get the next keyboard key from buffer.
+        Walk a chunk of terminal bytes and map it to KeyCodes.
 
-        Handles platform-specific escape sequences:
-        - Windows: Arrow keys send 0xe0 (224) or 0x00 (0) followed by key code
-        - Linux: Arrow keys send ESC [ A/B/C/D sequences
+        A trailing partial escape sequence (bare ESC or ESC plus a
+        '['/'O' prefix with no final byte yet) is returned as the
+        remainder so the caller can wait for its continuation.
 
         Returns:
-            KeyCode enum or None if no key available
+            Tuple of (parsed keys, unconsumed trailing bytes)
+        """
+        keys: List[KeyCode] = []
+        i = 0
+        n = len(data)
+        while i < n:
+            byte = data[i]
+            if byte == 0x1b:  # ESC
+                if i + 1 >= n:
+                    # Might be a bare ESC or a split sequence; defer
+                    return keys, data[i:]
+                if data[i + 1] in (0x5b, 0x4f):  # '[' or 'O'
+                    if i + 2 >= n:
+                        return keys, data[i:]
+                    keys.append(self._POSIX_ARROW_MAP.get(data[i + 2], KeyCode.UNKNOWN))
+                    i += 3
+                    continue
+                keys.append(KeyCode.ESC)
+            elif byte in (0x0d, 0x0a):  # CR / LF
+                keys.append(KeyCode.ENTER)
+            else:
+                keys.append(KeyCode.UNKNOWN)
+            i += 1
+        return keys, b''
+
+    def _posix_loop(self) -> None:
+        """POSIX input loop: block in the selector with no timeout.
+
+        The selector (epoll-backed on Linux) is registered once in
+        start() for stdin and the self-pipe, so the kernel fd set is
+        never rebuilt per iteration. stop() writes a byte to the pipe
+        to unblock the call; the thread never wakes spuriously while
+        idle.
+
+        os.read pulls whole escape sequences in one syscall, so they
+        are parsed here in one pass. Only a sequence split across
+        reads waits (briefly) for its continuation; a lone ESC that
+        gets no continuation is emitted as KeyCode.ESC.
         """
+        fd = sys.stdin.fileno()
+        pending = b''
+        while self._running:
+            try:
+                events = self._selector.select(timeout=0.03 if pending else None)
+
+                if not events:
+                    # Timed out waiting for a continuation: the dangling
+                    # ESC stands alone (drop any orphaned prefix byte)
+                    self._push_keys([KeyCode.ESC])
+                    pending = b''
+                    continue
+
+                stdin_ready = False
+                for key, _ in events:
+                    if key.data == "wake":
+                        return
+                    stdin_ready = True
+
+                if stdin_ready:
+                    data = os.read(fd, 64)
+                    if not data:
+                        # EOF (e.g. piped input exhausted): the fd stays
+                        # readable forever, so selecting again would spin.
+                        # Flush a dangling ESC and retire the thread.
+                        if pending:
+                            self._push_keys([KeyCode.ESC])
+                        return
+                    keys, pending = self._parse_posix_bytes(pending + data)
+                    if keys:
+                        self._push_keys(keys)
+            except Exception:
+                pass
 
-        def _as_str(x):
-            if isinstance(x, bytes):
-                return x.decode('latin-1', errors='ignore')
-            if isinstance(x, int):
-                try:
-                    return chr(x)
-                except:
-                    return ''
-            return x if isinstance(x, str) else str(x)
+    def get_key(self, timeout: Optional[float] = 0) -> Optional[KeyCode]:
+        """
+        Get the next keyboard key from buffer.
 
-        with self._lock:
-            if not self._key_buffer:
-                return None
-            char = self._key_buffer.pop(0)
+        Escape sequences are already parsed by the reader threads, so
+        this is a plain queue pop. Blocks until a key is available, the
+        timeout expires, or the handler is stopped. A timeout of 0
+        polls without blocking; None blocks indefinitely.
 
-        char = _as_str(char)
+        Args:
+            timeout: Seconds to wait for a key (None = wait forever)
 
-        # === WINDOWS ARROW KEY HANDLING ===
-        if sys.platform == "win32":
-            # Windows sends bytes, convert them
-            if isinstance(char, bytes):
-                char_byte = char
-                try:
-                    char = char.decode('utf-8', errors='ignore')
-                except:
-                    char_byte_val = ord(char_byte) if len(char_byte) > 0 else 0
-            else:
-                char_byte_val = ord(char) if len(char) > 0 else 0
-                char_byte = char.encode('latin-1', errors='ignore')
-
-            # On Windows, special keys are preceded by 0xe0 (224) or 0x00 (0)
-            if char == '\xe0' or char == '\x00' or (
-                    isinstance(char_byte, bytes) and char_byte in (b'\xe0', b'\x00')):
-                # Read the next byte containing the key code
-                with self._lock:
-                    if self._key_buffer:
-                        next_char = self._key_buffer.pop(0)
-                    else:
-                        next_char = None
-
-                if next_char is not None:
-                    next_char = _as_str(next_char)
-
-                    # Windows arrow key codes
-                    # H = 72 (0x48) = UP
-                    # P = 80 (0x50) = DOWN
-                    # M = 77 (0x4D) = RIGHT
-                    # K = 75 (0x4B) = LEFT
-                    if next_char == 'H' or ord(next_char) == 72:
-                        return KeyCode.UP
-                    elif next_char == 'P' or ord(next_char) == 80:
-                        return KeyCode.DOWN
-                    elif next_char == 'M' or ord(next_char) == 77:
-                        return KeyCode.RIGHT
-                    elif next_char == 'K' or ord(next_char) == 75:
-                        return KeyCode.LEFT
-                return KeyCode.UNKNOWN
-
-            elif char == '\r' or char == '\n':
-                return KeyCode.ENTER
-
-            elif char == '\x1b':
-                return KeyCode.ESC
-
-        # === LINUX/UNIX ARROW KEY HANDLING ===
-        else:
-            # On Linux/Unix, arrows send ESC [ A/B/C/D sequences
-            if char == '\x1b':  # ESC character
-                # Wait to see if it's an escape sequence or just ESC
-                deadline = time.monotonic() + 0.03
-                prefix = None
-                arrow_char = None
-
-                while time.monotonic() < deadline:
-                    with self._lock:
-                        if len(self._key_buffer) >= 2 and _as_str(self._key_buffer[0]) in ('[', 'O'):
-                            prefix = _as_str(self._key_buffer.pop(0))
-                            arrow_char = _as_str(self._key_buffer.pop(0))
-                            break
-                    time.sleep(0.001)  # Small timeout to distinguish ESC from sequences
-
-                if prefix in ('[', 'O') and arrow_char is not None:
-                    # Escape sequence detected, consume '[' and map direction
-                    # A = UP, B = DOWN, C = RIGHT, D = LEFT
-                    if arrow_char == 'A':
-                        return KeyCode.UP
-                    elif arrow_char == 'B':
-                        return KeyCode.DOWN
-                    elif arrow_char == 'C':
-                        return KeyCode.RIGHT
-                    elif arrow_char == 'D':
-                        return KeyCode.LEFT
-                    return KeyCode.UNKNOWN
-
-                # If not an arrow sequence, it's just ESC
-                return KeyCode.ESC
-
-            elif char == '\r' or char == '\n':
-                return KeyCode.ENTER
-
-        return KeyCode.UNKNOWN
-
-@dataclass
+        Returns:
+            KeyCode enum or None if no key available
+        """
+        try:
+            if timeout == 0:
+                return self._key_buffer.get_nowait()
+            return self._key_buffer.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+@dataclass(slots=True)
 class Entry:
     """Represents a menu entry (selectable item)."""
     label: str
@@ -270,53 +546,134 @@ class Entry:
     enabled: bool = True
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # Rendered row bytes cached per (width, theme token); labels rarely
+    # change, so steady-state frames reuse these. Page.invalidate()
+    # resets them after external label/enabled mutation.
+    _cached_normal: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _cached_selected: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _cached_width: int = field(default=-1, init=False, repr=False, compare=False)
+    _cached_token: int = field(default=-1, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # One-shot validation at construction time; mutations afterwards
+        # are plain attribute writes with no per-access overhead
+        if not self.label.strip():
+            raise ValueError("Entry label must not be blank")
+
     def execute(self) -> Optional[str]:
         """
         Execute the entry's action and return the next page name if any.
 
+        Entries without an action (the common case for pure navigation)
+        skip the try/except and result inspection entirely.
+
         Returns:
             Optional page name to navigate to
         """
-        if self.action:
-            try:
-                result = self.action()
-                if isinstance(result, str):
-                    return result
-            except Exception as e:
-                print(f"\nError executing action: {e}")
-                input("\nPress Enter to continue...")
+        if self.action is None:
+            return self.next_page
+
+        try:
+            result = self.action()
+            if isinstance(result, str):
+                return result
+        except Exception as e:
+            print(f"\n{EntryActionError(self.label, e)}")
+            input("\nPress Enter to continue...")
 
         return self.next_page
 
 
-@dataclass
+@dataclass(slots=True)
 class Page:
     """Represents a menu page with title and entries."""
     name: str
     title: str
     entries: List[Entry] = field(default_factory=list)
     selected_index: int = 0
+    # Bumped on structural changes so renderers can detect stale frames
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    # Cached filtered view of enabled entries; None means stale
+    _active_cache: Optional[List[Entry]] = field(default=None, init=False, repr=False, compare=False)
+    # Indices of enabled entries and their positions, for O(1) navigation
+    _enabled_indices: Optional[List[int]] = field(default=None, init=False, repr=False, compare=False)
+    _enabled_pos: Optional[Dict[int, int]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if not self.title:
+            self.title = self.name
 
     def add_entry(self, entry: Entry) -> 'Page':
         """Add an entry to this page."""
         self.entries.append(entry)
+        self._version += 1
+        self._active_cache = None
+        self._enabled_indices = None
         return self
 
+    @property
+    def active_entries(self) -> List[Entry]:
+        """
+        Enabled entries only, cached between structural changes.
+
+        Mutating an entry's ``enabled`` flag directly does not refresh
+        this view; call :meth:`invalidate` afterwards.
+        """
+        if self._active_cache is None:
+            self._active_cache = [e for e in self.entries if e.enabled]
+        return self._active_cache
+
+    def invalidate(self) -> None:
+        """Drop cached views after external mutation of entries."""
+        self._active_cache = None
+        self._enabled_indices = None
+        self._version += 1
+        for entry in self.entries:
+            entry._cached_width = -1
+
+    def _ensure_enabled_index(self) -> None:
+        """Rebuild the enabled-index lookup tables if stale."""
+        if self._enabled_indices is None:
+            self._enabled_indices = [
+                i for i, e in enumerate(self.entries) if e.enabled
+            ]
+            self._enabled_pos = {
+                idx: pos for pos, idx in enumerate(self._enabled_indices)
+            }
+
     def move_up(self) -> None:
-        """Move selection up."""
-        if self.entries:
-            self.selected_index = (self.selected_index - 1) % len(self.entries)
+        """Move selection up, jumping over disabled entries."""
+        self._ensure_enabled_index()
+        enabled = self._enabled_indices
+        if not enabled:
+            return
+        pos = self._enabled_pos.get(self.selected_index)
+        if pos is None:
+            # Selection sits on a disabled entry; snap to the first enabled
+            self.selected_index = enabled[0]
+        else:
+            self.selected_index = enabled[(pos - 1) % len(enabled)]
 
     def move_down(self) -> None:
-        """Move selection down."""
-        if self.entries:
-            self.selected_index = (self.selected_index + 1) % len(self.entries)
+        """Move selection down, jumping over disabled entries."""
+        self._ensure_enabled_index()
+        enabled = self._enabled_indices
+        if not enabled:
+            return
+        pos = self._enabled_pos.get(self.selected_index)
+        if pos is None:
+            self.selected_index = enabled[0]
+        else:
+            self.selected_index = enabled[(pos + 1) % len(enabled)]
 
     def get_selected_entry(self) -> Optional[Entry]:
-        """Get the currently selected entry."""
-        if 0 <= self.selected_index < len(self.entries):
-            return self.entries[self.selected_index]
-        return None
+        """Get the currently selected entry.
+
+        move_up/move_down keep selected_index within range, so only the
+        empty-entries case needs a guard.
+        """
+        entries = self.entries
+        return entries[self.selected_index] if entries else None
 
 
 class TerminalMenu:
@@ -339,6 +696,8 @@ class TerminalMenu:
         >>> menu.run()
     """
 
+    HELP_TEXT = "↑/↓: Navigate | Enter: Select | Esc: Back/Exit"
+
     def __init__(
             self,
             theme_color: str = Colors.BRIGHT_CYAN,
@@ -359,8 +718,13 @@ class TerminalMenu:
         """
         self.pages: Dict[str, Page] = {}
         self.current_page_name: Optional[str] = None
+        # Resolved Page object for the current page, kept in sync by
+        # navigation so render/run skip the dict lookup per frame
+        self._current_page: Optional[Page] = None
         self.start_page_name: Optional[str] = None
-        self.page_history: List[str] = []
+        # Bounded so a long-lived session cannot grow it without limit;
+        # 256 levels is far deeper than any practical menu tree
+        self.page_history: deque = deque(maxlen=256)
         self.running = False
 
         # Theme settings
@@ -370,20 +734,75 @@ class TerminalMenu:
         self.min_width = min_width
         self.min_height = min_height
 
+        # Adjacent SGR sequences merged once at construction so each
+        # frame row writes one escape sequence where it used to write
+        # two or three
+        self._selected_sgr = _merge_sgr(Colors.RESET, selected_bg, selected_fg)
+        self._reset_theme_sgr = _merge_sgr(Colors.RESET, theme_color)
+        self._reset_dim_sgr = _merge_sgr(Colors.RESET, Colors.DIM)
+
+        # Static frame lines cached per content width; they depend only
+        # on (theme, width), so steady-state navigation reuses them.
+        # Stored pre-encoded: the render path works in bytes end to end
+        self._tpl_cache: Dict[int, Dict[str, bytes]] = {}
+        # Rendered top border keyed by (width, title); titles are per
+        # page but constant, so each (page, width) pair formats once
+        self._top_cache: Dict[Tuple[int, str], bytes] = {}
+
+        # Theme fragments pre-encoded once; frames are assembled from
+        # bytes and written to sys.stdout.buffer, skipping the
+        # TextIOWrapper encoder on every frame
+        self._encode_theme()
+
+        # Bumped on theme changes to invalidate per-entry row caches
+        self._row_token = 0
+
+        # Terminal size cache: on POSIX a SIGWINCH handler (installed
+        # while run() is active) marks it dirty, so idle frames skip
+        # the ioctl; Windows re-checks at most twice per second
+        self._cached_size: Optional[Tuple[int, int]] = None
+        self._size_dirty = True
+        self._size_checked_at = 0.0
+        self._winch_installed = False
+
         # Keyboard handler
         self.keyboard = KeyboardInput()
 
+        # Last rendered (page, selection, version) tuple; None forces a redraw
+        self._last_render_key: Optional[Tuple[str, int, int]] = None
+        # Full render() state key including terminal size; lets direct
+        # render() calls no-op when nothing visible changed
+        self._last_state: Optional[Tuple[str, int, int, int, int]] = None
+
+        # Damage tracking: last rendered frame lines and where they were
+        # drawn, so navigation can rewrite only the lines that changed
+        self._prev_lines: Optional[List[bytes]] = None
+        self._prev_origin: Optional[Tuple[int, int]] = None
+        self._prev_size: Optional[Tuple[int, int]] = None
+
         # Action registry for JSON callbacks
         self._action_registry: Dict[str, Callable] = {}
 
+    def _encode_theme(self) -> None:
+        """Pre-encode theme fragments used by the bytes render path."""
+        self._theme_b = self.theme_color.encode('utf-8')
+        self._reset_b = Colors.RESET.encode('utf-8')
+        self._selected_sgr_b = self._selected_sgr.encode('utf-8')
+        self._reset_theme_sgr_b = self._reset_theme_sgr.encode('utf-8')
+
     @staticmethod
     def clear_screen() -> None:
-        """Clear the terminal screen (cross-platform)."""
-        if sys.platform == "win32":
-            os.system('cls')
-        else:
+        """Clear the terminal screen (cross-platform).
+
+        Uses ANSI escapes everywhere the terminal accepts them; the
+        cmd.exe spawn is only a last resort for consoles where VT
+        processing could not be enabled.
+        """
+        if _VT_ENABLED:
             sys.stdout.write("\033[2J\033[H")
             sys.stdout.flush()
+        else:
+            os.system('cls')
 
     @staticmethod
     def hide_cursor() -> None:
@@ -397,18 +816,143 @@ class TerminalMenu:
         sys.stdout.write("\033[?25h")
         sys.stdout.flush()
 
+    def _on_resize(self, signum, frame) -> None:
+        """SIGWINCH handler: mark the cached terminal size stale."""
+        self._size_dirty = True
+
+    def _install_resize_handler(self) -> None:
+        """Install the SIGWINCH handler while the event loop runs (POSIX)."""
+        if sys.platform == "win32":
+            return
+        try:
+            self._prev_winch = signal.signal(signal.SIGWINCH, self._on_resize)
+            self._winch_installed = True
+        except ValueError:
+            # Not the main thread; fall back to querying every call
+            self._winch_installed = False
+
+    def _remove_resize_handler(self) -> None:
+        """Restore the previous SIGWINCH disposition."""
+        if self._winch_installed:
+            try:
+                signal.signal(signal.SIGWINCH, self._prev_winch)
+            except ValueError:
+                pass
+            self._winch_installed = False
+
     def get_terminal_size(self) -> Tuple[int, int]:
         """
         Get current terminal size.
 
+        The underlying ioctl is only issued when the cache is stale:
+        after SIGWINCH on POSIX (while run() is active), or at most
+        every 0.5 s on Windows. Outside the event loop the size is
+        queried directly.
+
         Returns:
             Tuple of (width, height)
         """
+        if self._cached_size is not None:
+            if self._winch_installed:
+                if not self._size_dirty:
+                    return self._cached_size
+            elif sys.platform == "win32":
+                now = time.monotonic()
+                if now - self._size_checked_at < 0.5:
+                    return self._cached_size
+                self._size_checked_at = now
+
         try:
             size = shutil.get_terminal_size((80, 24))
-            return max(size.columns, self.min_width), max(size.lines, self.min_height)
+            result = (max(size.columns, self.min_width), max(size.lines, self.min_height))
         except Exception:
-            return 80, 24
+            result = (80, 24)
+
+        self._cached_size = result
+        self._size_dirty = False
+        return result
+
+    def set_theme(
+            self,
+            theme_color: Optional[str] = None,
+            selected_bg: Optional[str] = None,
+            selected_fg: Optional[str] = None
+    ) -> 'TerminalMenu':
+        """
+        Change theme colors, recomputing derived sequences and caches.
+
+        Args:
+            theme_color: Color for borders and title
+            selected_bg: Background color for selected entry
+            selected_fg: Foreground color for selected entry
+
+        Returns:
+            Self for method chaining
+        """
+        if theme_color is not None:
+            self.theme_color = theme_color
+        if selected_bg is not None:
+            self.selected_bg = selected_bg
+        if selected_fg is not None:
+            self.selected_fg = selected_fg
+
+        self._selected_sgr = _merge_sgr(Colors.RESET, self.selected_bg, self.selected_fg)
+        self._reset_theme_sgr = _merge_sgr(Colors.RESET, self.theme_color)
+        self._encode_theme()
+        self._tpl_cache = {}
+        self._top_cache = {}
+        self._row_token += 1
+        self._invalidate_screen()
+        return self
+
+    def _get_templates(self, content_width: int) -> Dict[str, bytes]:
+        """Build (or fetch) the static frame lines for a content width.
+
+        Values are UTF-8 encoded once; the horizontal rule is stored as
+        bytes too (the box-drawing char is 3 bytes, so slices must use
+        multiples of its encoded length).
+        """
+        tpl = self._tpl_cache.get(content_width)
+        if tpl is None:
+            h_line = _hline(content_width)
+            empty_row = (
+                f"{self.theme_color}{BoxChars.VERTICAL}"
+                f"{' ' * content_width}{BoxChars.VERTICAL}{Colors.RESET}"
+            )
+            help_padding = (content_width - len(self.HELP_TEXT)) // 2
+            help_line = (
+                f"{self.theme_color}{BoxChars.VERTICAL}"
+                f"{self._reset_dim_sgr}{' ' * help_padding}{self.HELP_TEXT}"
+                f"{' ' * (content_width - help_padding - len(self.HELP_TEXT))}"
+                f"{self._reset_theme_sgr}{BoxChars.VERTICAL}{Colors.RESET}"
+            )
+            bottom = (
+                f"{self.theme_color}{BoxChars.BOTTOM_LEFT}"
+                f"{h_line}{BoxChars.BOTTOM_RIGHT}{Colors.RESET}"
+            )
+            tpl = {
+                "h_line": _hline_bytes(content_width),
+                "empty": empty_row.encode('utf-8'),
+                "help": help_line.encode('utf-8'),
+                "bottom": bottom.encode('utf-8'),
+            }
+            self._tpl_cache[content_width] = tpl
+        return tpl
+
+    @staticmethod
+    def _write_frame(data: bytes) -> None:
+        """Write an assembled frame in one call, bypassing the text layer.
+
+        Falls back to the text stream for non-standard stdouts that
+        expose no binary buffer (e.g. test harness redirections).
+        """
+        out = getattr(sys.stdout, "buffer", None)
+        if out is not None:
+            out.write(data)
+            out.flush()
+        else:
+            sys.stdout.write(data.decode('utf-8'))
+            sys.stdout.flush()
 
     def add_page(self, name: str, title: str = "") -> Page:
         """
@@ -420,7 +964,12 @@ class TerminalMenu:
 
         Returns:
             The created Page object for method chaining
+
+        Raises:
+            DuplicatePageError: If a page with this name already exists
         """
+        if name in self.pages:
+            raise DuplicatePageError(name)
         page = Page(name=name, title=title or name)
         self.pages[name] = page
         return page
@@ -434,9 +983,15 @@ class TerminalMenu:
 
         Returns:
             Self for method chaining
+
+        Raises:
+            PageNotFoundError: If the page has not been added
         """
+        if page_name not in self.pages:
+            raise PageNotFoundError(page_name)
         self.start_page_name = page_name
         self.current_page_name = page_name
+        self._current_page = self.pages[page_name]
         return self
 
     def register_action(self, name: str, callback: Callable) -> 'TerminalMenu':
@@ -460,10 +1015,13 @@ class TerminalMenu:
         Args:
             page_name: Name of the page to navigate to
         """
-        if page_name in self.pages:
+        # Validate and fetch in one dict lookup
+        page = self.pages.get(page_name)
+        if page is not None:
             if self.current_page_name:
                 self.page_history.append(self.current_page_name)
             self.current_page_name = page_name
+            self._current_page = page
 
     def go_back(self) -> bool:
         """
@@ -473,98 +1031,224 @@ class TerminalMenu:
             True if navigation succeeded, False if no history
         """
         if self.page_history:
-            self.current_page_name = self.page_history.pop()
+            name = self.page_history.pop()
+            self.current_page_name = name
+            self._current_page = self.pages.get(name)
             return True
         return False
 
+    def _resolve_current_page(self) -> Optional[Page]:
+        """Return the current Page, resolving the name lazily if needed."""
+        page = self._current_page
+        if page is None and self.current_page_name:
+            page = self.pages.get(self.current_page_name)
+            self._current_page = page
+        return page
+
+    def _handle_selection(self, page: Page) -> None:
+        """Execute the selected entry and follow its navigation target."""
+        entry = page.get_selected_entry()
+        if entry:
+            if entry.action:
+                # The action may write to the screen, so the next frame
+                # cannot be skipped or diffed against the previous one
+                self._invalidate_screen()
+            next_page = entry.execute()
+            if next_page:
+                self.go_to(next_page)
+
+    def _render_if_changed(self) -> None:
+        """Render only when the visible page state differs from last frame."""
+        page = self._resolve_current_page()
+        if page is None:
+            render_key = None
+        else:
+            render_key = (page.name, page.selected_index, page._version)
+
+        if render_key is None or render_key != self._last_render_key:
+            self.render()
+            self._last_render_key = render_key
+
+    def _invalidate_screen(self) -> None:
+        """Force the next render to redraw the whole screen."""
+        self._last_render_key = None
+        self._last_state = None
+        self._prev_lines = None
+
     def render(self) -> None:
-        """Render the current page to the terminal."""
-        self.clear_screen()
+        """Render the current page to the terminal.
 
-        if not self.current_page_name or self.current_page_name not in self.pages:
+        A full clear + repaint only happens when the frame geometry
+        changed (resize, page switch to a different entry count) or the
+        screen was dirtied by an action; otherwise only the lines that
+        differ from the previous frame are rewritten in place.
+        """
+        page = self._resolve_current_page()
+        if page is None:
+            self.clear_screen()
+            self._prev_lines = None
             print("Error: No valid page to display")
             return
 
-        page = self.pages[self.current_page_name]
         term_width, term_height = self.get_terminal_size()
 
-        # Calculate menu dimensions
-        content_width = min(term_width - 4, 70)
-        content_height = min(term_height - 6, len(page.entries) + 8)
-
-        # Calculate centering offset
-        x_offset = (term_width - content_width - 2) // 2
-        y_offset = max(1, (term_height - content_height) // 2)
-
-        # Build the menu frame
-        lines = []
-
-        # Top border with title
-        title_text = f"[ {page.title} ]"
-        title_padding = (content_width - len(title_text)) // 2
-        top_line = (
-            f"{BoxChars.TOP_LEFT}"
-            f"{BoxChars.HORIZONTAL * title_padding}"
-            f"{title_text}"
-            f"{BoxChars.HORIZONTAL * (content_width - title_padding - len(title_text))}"
-            f"{BoxChars.TOP_RIGHT}"
-        )
-        lines.append(f"{self.theme_color}{top_line}{Colors.RESET}")
+        # Identical page state at the same terminal size produces an
+        # identical frame; skip the whole build in that case
+        state = (page.name, page.selected_index, page._version, term_width, term_height)
+        if state == self._last_state and self._prev_lines is not None:
+            return
+        self._last_state = state
+
+        # Menu dimensions and centering offsets, memoized per
+        # (terminal size, entry count)
+        content_width, content_height, x_offset, y_offset = _compute_layout(
+            term_width, term_height, len(page.entries))
+
+        # Build the menu frame as bytes; static lines come from the
+        # per-width template cache
+        tpl = self._get_templates(content_width)
+        lines: List[bytes] = []
+        append = lines.append
+
+        # Top border with title, cached per (width, title). The cached
+        # rule is UTF-8 bytes, so slices count 3 bytes per box char
+        top_key = (content_width, page.title)
+        top_line = self._top_cache.get(top_key)
+        if top_line is None:
+            title_text = f"[ {page.title} ]"
+            title_width = _display_width(title_text)
+            # Clamp both rule slices: a title wider than the content
+            # area would make the paddings negative, and a negative
+            # slice length counts from the end of the rule instead of
+            # yielding nothing
+            title_padding = max(0, (content_width - title_width) // 2)
+            h_line = tpl["h_line"]
+            top_line = b"".join((
+                self._theme_b,
+                _TOP_LEFT_B,
+                h_line[:3 * title_padding],
+                title_text.encode('utf-8'),
+                h_line[:3 * max(0, content_width - title_padding - title_width)],
+                _TOP_RIGHT_B,
+                self._reset_b,
+            ))
+            self._top_cache[top_key] = top_line
+        append(top_line)
 
         # Empty line
-        lines.append(f"{self.theme_color}{BoxChars.VERTICAL}{' ' * content_width}{BoxChars.VERTICAL}{Colors.RESET}")
+        append(tpl["empty"])
+
+        # Menu entries: both row variants are cached on the entry keyed
+        # by (width, theme token), so steady-state navigation only picks
+        # which cached bytes to append
+        theme = self._theme_b
+        reset = self._reset_b
+        vert = _VERTICAL_B
+        sel_sgr = self._selected_sgr_b
+        reset_theme = self._reset_theme_sgr_b
+        selected_index = page.selected_index
+        token = self._row_token
 
-        # Menu entries
         for idx, entry in enumerate(page.entries):
-            if idx == page.selected_index:
-                # Highlight selected entry
-                entry_text = f" {entry.label} "
-                padding = content_width - len(entry_text)
-                line = (
-                    f"{self.theme_color}{BoxChars.VERTICAL}{Colors.RESET}"
-                    f"{self.selected_bg}{self.selected_fg}{entry_text}"
-                    f"{' ' * padding}{Colors.RESET}"
-                    f"{self.theme_color}{BoxChars.VERTICAL}{Colors.RESET}"
+            if entry._cached_width != content_width or entry._cached_token != token:
+                label_b = entry.label.encode('utf-8')
+                # %-*b pads by byte length, so widen the field by the
+                # difference between encoded length and cell width to
+                # land on the right number of terminal cells
+                slack = len(label_b) - _display_width(entry.label)
+                entry._cached_selected = b"%b%b%b %-*b%b%b%b" % (
+                    theme, vert, sel_sgr,
+                    content_width - 1 + slack, label_b,
+                    reset_theme, vert, reset,
                 )
-            else:
-                entry_text = f" {entry.label}"
-                padding = content_width - len(entry_text)
-                line = (
-                    f"{self.theme_color}{BoxChars.VERTICAL}{Colors.RESET}"
-                    f" {entry_text}{' ' * (padding - 1)}"
-                    f"{self.theme_color}{BoxChars.VERTICAL}{Colors.RESET}"
+                entry._cached_normal = b"%b%b%b  %-*b%b%b%b" % (
+                    theme, vert, reset,
+                    content_width - 2 + slack, label_b,
+                    theme, vert, reset,
                 )
-            lines.append(line)
+                entry._cached_width = content_width
+                entry._cached_token = token
+            append(entry._cached_selected if idx == selected_index else entry._cached_normal)
+
+        # Empty line, help line and bottom border are fully static
+        append(tpl["empty"])
+        append(tpl["help"])
+        append(tpl["bottom"])
+
+        # Emit: damage-only rewrite when geometry is unchanged, full
+        # repaint otherwise
+        origin = (x_offset, y_offset)
+        size = (term_width, term_height)
+        if (_VT_ENABLED
+                and self._prev_lines is not None
+                and self._prev_origin == origin
+                and self._prev_size == size
+                and len(self._prev_lines) == len(lines)):
+            self._render_partial(lines, x_offset, y_offset)
+        else:
+            self._render_full(lines, x_offset, y_offset)
 
-        # Empty line
-        lines.append(f"{self.theme_color}{BoxChars.VERTICAL}{' ' * content_width}{BoxChars.VERTICAL}{Colors.RESET}")
-
-        # Help line
-        help_text = "↑/↓: Navigate | Enter: Select | Esc: Back/Exit"
-        help_padding = (content_width - len(help_text)) // 2
-        help_line = (
-            f"{self.theme_color}{BoxChars.VERTICAL}{Colors.RESET}"
-            f"{Colors.DIM}{' ' * help_padding}{help_text}"
-            f"{' ' * (content_width - help_padding - len(help_text))}{Colors.RESET}"
-            f"{self.theme_color}{BoxChars.VERTICAL}{Colors.RESET}"
-        )
-        lines.append(help_line)
-
-        # Bottom border
-        bottom_line = (
-            f"{BoxChars.BOTTOM_LEFT}"
-            f"{BoxChars.HORIZONTAL * content_width}"
-            f"{BoxChars.BOTTOM_RIGHT}"
-        )
-        lines.append(f"{self.theme_color}{bottom_line}{Colors.RESET}")
-
-        # Print with offset
-        output = "\n" * y_offset
+        self._prev_lines = lines
+        self._prev_origin = origin
+        self._prev_size = size
+
+    def _render_full(self, lines: List[bytes], x_offset: int, y_offset: int) -> None:
+        """Repaint the whole frame in a single write.
+
+        Instead of erasing the screen and then drawing (which shows a
+        blank flash between the two), home the cursor and overwrite
+        every row, erasing each row's tail with \\033[K and anything
+        below the frame with \\033[J. Every cell is covered in one
+        pass, so no clear-then-draw flicker is visible.
+        """
+        # Accumulate into one growable buffer instead of a list of
+        # fragments joined at the end; the frame is copied exactly once
+        buf = bytearray(_SYNC_BEGIN) if _VT_ENABLED else bytearray()
+        extend = buf.extend
+        if _VT_ENABLED:
+            extend(b"\033[H")
+            if y_offset <= 64:
+                # memoryview slice: no intermediate bytes allocation
+                extend(memoryview(_ERASE_NL_BLOCK)[:4 * y_offset])
+            else:
+                extend(b"\033[K\n" * y_offset)
+            line_end = b"\033[K\n"
+        else:
+            # Legacy console without VT support: cls cannot be batched
+            # into the byte stream
+            self.clear_screen()
+            if y_offset <= 64:
+                extend(memoryview(_NL_BLOCK)[:y_offset])
+            else:
+                extend(b"\n" * y_offset)
+            line_end = b"\n"
+        indent = _pad_bytes(x_offset)
         for line in lines:
-            output += " " * x_offset + line + "\n"
+            extend(indent)
+            extend(line)
+            extend(line_end)
+        if _VT_ENABLED:
+            extend(b"\033[J")
+            extend(_SYNC_END)
 
-        sys.stdout.write(output)
-        sys.stdout.flush()
+        self._write_frame(bytes(buf))
+
+    def _render_partial(self, new_lines: List[bytes], x_offset: int, y_offset: int) -> None:
+        """Rewrite only the lines that differ from the previous frame.
+
+        On arrow-key navigation this is typically two rows (the old and
+        new selection) instead of the whole frame, and no screen clear.
+        """
+        buf = bytearray(_SYNC_BEGIN)
+        extend = buf.extend
+        for i, (old, new) in enumerate(zip(self._prev_lines, new_lines)):
+            if old != new:
+                # Terminal coordinates are 1-based
+                extend(b"\033[%d;%dH" % (y_offset + 1 + i, x_offset + 1))
+                extend(new)
+        if len(buf) > len(_SYNC_BEGIN):
+            extend(_SYNC_END)
+            self._write_frame(bytes(buf))
 
     def run(self) -> None:
         """
@@ -583,51 +1267,63 @@ class TerminalMenu:
         self.running = True
         self.hide_cursor()
         self.keyboard.start()
+        self._install_resize_handler()
 
         try:
             last_size = self.get_terminal_size()
-            self.render()
+            self._render_if_changed()
+
+            last_page: Optional[Page] = None
+            handlers: Dict[KeyCode, Callable[[], None]] = {}
+            handlers_get = handlers.get
+
+            # Hoist the per-iteration attribute chains into locals; the
+            # loop body then runs almost entirely on LOAD_FAST
+            get_size = self.get_terminal_size
+            resolve_page = self._resolve_current_page
+            get_key = self.keyboard.get_key
+            render_if_changed = self._render_if_changed
 
             while self.running:
                 # Check for terminal resize
-                current_size = self.get_terminal_size()
+                current_size = get_size()
                 if current_size != last_size:
                     last_size = current_size
-                    self.render()
-
-                # Handle keyboard input
-                key = self.keyboard.get_key()
-
-                if key == KeyCode.UP:
-                    if self.current_page_name in self.pages:
-                        self.pages[self.current_page_name].move_up()
-                        self.render()
-
-                elif key == KeyCode.DOWN:
-                    if self.current_page_name in self.pages:
-                        self.pages[self.current_page_name].move_down()
-                        self.render()
-
-                elif key == KeyCode.ENTER:
-                    if self.current_page_name in self.pages:
-                        page = self.pages[self.current_page_name]
-                        entry = page.get_selected_entry()
+                    self._last_render_key = None  # force a redraw
+
+                # Rebuild the dispatch table only when the page changes;
+                # key handling is then a single dict lookup
+                page = resolve_page()
+                if page is not last_page:
+                    last_page = page
+                    if page is not None:
+                        handlers = {
+                            KeyCode.UP: page.move_up,
+                            KeyCode.DOWN: page.move_down,
+                            KeyCode.ENTER: lambda p=page: self._handle_selection(p),
+                        }
+                    else:
+                        handlers = {}
+                    handlers_get = handlers.get
 
-                        if entry:
-                            next_page = entry.execute()
-                            if next_page:
-                                self.go_to(next_page)
-                            self.render()
+                # Handle keyboard input (blocks until a key arrives or the
+                # timeout expires, so the loop sleeps in the kernel instead
+                # of spinning)
+                key = get_key(timeout=0.05)
 
+                handler = handlers_get(key) if key is not None else None
+                if handler is not None:
+                    handler()
                 elif key == KeyCode.ESC:
                     if not self.go_back():
                         self.running = False
-                    else:
-                        self.render()
 
-                time.sleep(0.05)
+                # Redraw only when the visible state actually changed;
+                # ignored keys and idle timeouts write nothing
+                render_if_changed()
 
         finally:
+            self._remove_resize_handler()
             self.keyboard.stop()
             self.show_cursor()
             self.clear_screen()
@@ -661,8 +1357,15 @@ class TerminalMenu:
         Returns:
             Configured TerminalMenu instance
         """
-        with open(json_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        cache_key = (os.path.abspath(json_path), os.stat(json_path).st_mtime)
+        config = _JSON_CACHE.get(cache_key)
+        if config is None:
+            # Read raw bytes: both parsers accept them, so the UTF-8
+            # decode step of read_text is skipped
+            with open(json_path, 'rb') as f:
+                raw = f.read()
+            config = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            _JSON_CACHE[cache_key] = config
 
         menu = cls()
 
@@ -671,19 +1374,34 @@ class TerminalMenu:
             for name, callback in action_registry.items():
                 menu.register_action(name, callback)
 
-        # Build pages
+        # Build pages. Page names and labels recur across large configs
+        # ("Back", "Exit", ...), so intern them: equal strings share one
+        # object, which shrinks memory and speeds up dict lookups keyed
+        # on them.
         pages_config = config.get("pages", {})
+        get_action = menu._action_registry.get
         for page_name, page_data in pages_config.items():
+            page_name = sys.intern(page_name)
             page = menu.add_page(page_name, page_data.get("title", page_name))
 
-            for entry_data in page_data.get("entries", []):
+            for index, entry_data in enumerate(page_data.get("entries", [])):
+                label = entry_data.get("label")
+                if label is None or not label.strip():
+                    # Surface the offending file/page/entry instead of
+                    # letting Entry's blank-label check raise a bare
+                    # ValueError with no context
+                    raise InvalidEntryConfigError(
+                        json_path, page_name, index,
+                        "missing or blank 'label'")
+
                 action_name = entry_data.get("action")
-                action = menu._action_registry.get(action_name) if action_name else None
+                action = get_action(action_name) if action_name else None
 
+                next_page = entry_data.get("next_page")
                 entry = Entry(
-                    label=entry_data.get("label", ""),
+                    label=sys.intern(label),
                     action=action,
-                    next_page=entry_data.get("next_page")
+                    next_page=sys.intern(next_page) if next_page is not None else None
                 )
                 page.add_entry(entry)
 